@@ -18,10 +18,22 @@ __all__ = [
     "float2bin16",
     "float2bin32",
     "float2bin64",
+    "int2bin8_array",
+    "uint2bin8_array",
+    "int2bin16_array",
+    "uint2bin16_array",
+    "int2bin32_array",
+    "uint2bin32_array",
+    "int2bin64_array",
+    "uint2bin64_array",
+    "float2bin16_array",
+    "float2bin32_array",
+    "float2bin64_array",
 ]
 
+import operator
 import struct
-from typing import Any
+from typing import Any, Iterable, List
 
 _BYTE_ORDERS = {
     "default": "@",
@@ -32,18 +44,121 @@ _BYTE_ORDERS = {
 }
 _BYTE_ORDER = _BYTE_ORDERS["big-endian"]
 
+_BYTE2BIN = tuple(f"{i:08b}" for i in range(256))
+
+_PACKERS = {
+    fmt: struct.Struct(_BYTE_ORDER + fmt) for fmt in "c?bBhHlLqQefdx"
+}
+
+# Minimal buffer size in bytes for which the vectorized NumPy conversion
+# beats the lookup table; below the crossover (measured at ~32 bytes, above
+# all fixed scalar widths) the per-call NumPy overhead dominates.
+_MIN_NUMPY_SIZE = 32
+
+_TO_ASCII_BITS = bytes.maketrans(bytes(range(2)), b"01")
+
+_np: Any = None
+
+
+def _numpy() -> Any:
+    """
+    Return the NumPy module, importing it on first use, or `None` if it is
+    not installed.
+    """
+    global _np
+    if _np is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _np = numpy
+    return _np if _np else None
+
+
+def _bytes2bits(buf: bytes) -> str:
+    """Convert the bytes of the buffer `buf` to their binary representation."""
+    np = _numpy()
+    if np is not None and len(buf) >= _MIN_NUMPY_SIZE:
+        bits = np.unpackbits(np.frombuffer(buf, dtype=np.uint8), bitorder="big")
+        return bits.tobytes().translate(_TO_ASCII_BITS).decode("ascii")
+    return "".join(map(_BYTE2BIN.__getitem__, buf))
+
 
 def _val2bin(x: Any, fmt: str) -> str:
     """
     Convert the value `x` to its binary representation using the format
     character `fmt`.
     """
-    return "".join(f"{b:0>8b}" for b in struct.pack(_BYTE_ORDER + fmt, x))
+    return _bytes2bits(_PACKERS[fmt].pack(x))
+
+
+def _int2bin(i: int, size: int, signed: bool = False) -> str:
+    """
+    Convert the integer `i` to its binary representation of the byte size
+    `size`.
+    """
+    try:
+        i = operator.index(i)
+    except TypeError:
+        raise struct.error("required argument is not an integer") from None
+    try:
+        buf = i.to_bytes(size, "big", signed=signed)
+    except OverflowError:
+        raise struct.error("argument out of range") from None
+    return _bytes2bits(buf)
+
+
+def _vals2bin(vals: Iterable[Any], fmt: str, dtype: str) -> List[str]:
+    """
+    Convert the values `vals` to their binary representations using the
+    format character `fmt` and the NumPy data type `dtype`.
+    """
+    np = _numpy()
+    if np is None:
+        return [_val2bin(x, fmt) for x in vals]
+    if not hasattr(vals, "__len__"):
+        vals = list(vals)
+    if dtype[1] == "f":
+        src = np.asarray(vals)
+        try:
+            with np.errstate(over="ignore"):
+                arr = src.astype(dtype)
+        except (TypeError, ValueError) as exc:
+            raise struct.error(str(exc)) from None
+        if not np.isfinite(arr).all():
+            with np.errstate(over="ignore"):
+                finite = np.isfinite(src.astype(">f8"))
+            if (finite & ~np.isfinite(arr)).any():
+                raise OverflowError(
+                    f"float too large to pack with {fmt} format"
+                )
+    elif isinstance(vals, np.ndarray):
+        if vals.dtype.kind not in "iub":
+            raise struct.error("required argument is not an integer")
+        limits = np.iinfo(dtype)
+        if vals.size and (vals.min() < limits.min or vals.max() > limits.max):
+            raise struct.error("argument out of range")
+        arr = vals.astype(dtype)
+    else:
+        # convert exactly via __index__ so large Python integers are not
+        # promoted to float and non-integers are rejected
+        try:
+            ints = list(map(operator.index, vals))
+        except TypeError:
+            raise struct.error("required argument is not an integer") from None
+        try:
+            arr = np.asarray(ints, dtype=dtype)
+        except OverflowError:
+            raise struct.error("argument out of range") from None
+    bits = np.unpackbits(np.frombuffer(arr.tobytes(), dtype=np.uint8))
+    chars = bits.tobytes().translate(_TO_ASCII_BITS).decode("ascii")
+    n_bits = 8 * arr.itemsize
+    return [chars[i : i + n_bits] for i in range(0, len(chars), n_bits)]
 
 
 def pad2bin8() -> str:
     """Convert the pad byte to its 8-bit binary representation."""
-    return "".join(f"{b:0>8b}" for b in struct.pack(_BYTE_ORDER + "x"))
+    return "".join(map(_BYTE2BIN.__getitem__, _PACKERS["x"].pack()))
 
 
 def byte2bin8(b: bytes) -> str:
@@ -58,42 +173,42 @@ def bool2bin8(b: bool) -> str:
 
 def int2bin8(i: int) -> str:
     """Convert the signed integer `i` to its 8-bit binary representation."""
-    return _val2bin(i, "b")
+    return _int2bin(i, 1, signed=True)
 
 
 def uint2bin8(i: int) -> str:
     """Convert the unsigned integer `i` to its 8-bit binary representation."""
-    return _val2bin(i, "B")
+    return _int2bin(i, 1)
 
 
 def int2bin16(i: int) -> str:
     """Convert the signed integer `i` to its 16-bit binary representation."""
-    return _val2bin(i, "h")
+    return _int2bin(i, 2, signed=True)
 
 
 def uint2bin16(i: int) -> str:
     """Convert the unsigned integer `i` to its 16-bit binary representation."""
-    return _val2bin(i, "H")
+    return _int2bin(i, 2)
 
 
 def int2bin32(i: int) -> str:
     """Convert the signed integer `i` to its 32-bit binary representation."""
-    return _val2bin(i, "l")
+    return _int2bin(i, 4, signed=True)
 
 
 def uint2bin32(i: int) -> str:
     """Convert the unsigned integer `i` to its 32-bit binary representation."""
-    return _val2bin(i, "L")
+    return _int2bin(i, 4)
 
 
 def int2bin64(i: int) -> str:
     """Convert the signed integer `i` to its 64-bit binary representation."""
-    return _val2bin(i, "q")
+    return _int2bin(i, 8, signed=True)
 
 
 def uint2bin64(i: int) -> str:
     """Convert the unsigned integer `i` to its 64-bit binary representation."""
-    return _val2bin(i, "Q")
+    return _int2bin(i, 8)
 
 
 def float2bin16(f: float) -> str:
@@ -115,3 +230,87 @@ def float2bin64(f: float) -> str:
     Convert the floating-point number `f` to its 64-bit binary representation.
     """
     return _val2bin(f, "d")
+
+
+def int2bin8_array(vals: Iterable[int]) -> List[str]:
+    """
+    Convert the signed integers `vals` to their 8-bit binary representations.
+    """
+    return _vals2bin(vals, "b", ">i1")
+
+
+def uint2bin8_array(vals: Iterable[int]) -> List[str]:
+    """
+    Convert the unsigned integers `vals` to their 8-bit binary
+    representations.
+    """
+    return _vals2bin(vals, "B", ">u1")
+
+
+def int2bin16_array(vals: Iterable[int]) -> List[str]:
+    """
+    Convert the signed integers `vals` to their 16-bit binary representations.
+    """
+    return _vals2bin(vals, "h", ">i2")
+
+
+def uint2bin16_array(vals: Iterable[int]) -> List[str]:
+    """
+    Convert the unsigned integers `vals` to their 16-bit binary
+    representations.
+    """
+    return _vals2bin(vals, "H", ">u2")
+
+
+def int2bin32_array(vals: Iterable[int]) -> List[str]:
+    """
+    Convert the signed integers `vals` to their 32-bit binary representations.
+    """
+    return _vals2bin(vals, "l", ">i4")
+
+
+def uint2bin32_array(vals: Iterable[int]) -> List[str]:
+    """
+    Convert the unsigned integers `vals` to their 32-bit binary
+    representations.
+    """
+    return _vals2bin(vals, "L", ">u4")
+
+
+def int2bin64_array(vals: Iterable[int]) -> List[str]:
+    """
+    Convert the signed integers `vals` to their 64-bit binary representations.
+    """
+    return _vals2bin(vals, "q", ">i8")
+
+
+def uint2bin64_array(vals: Iterable[int]) -> List[str]:
+    """
+    Convert the unsigned integers `vals` to their 64-bit binary
+    representations.
+    """
+    return _vals2bin(vals, "Q", ">u8")
+
+
+def float2bin16_array(vals: Iterable[float]) -> List[str]:
+    """
+    Convert the floating-point numbers `vals` to their 16-bit binary
+    representations.
+    """
+    return _vals2bin(vals, "e", ">f2")
+
+
+def float2bin32_array(vals: Iterable[float]) -> List[str]:
+    """
+    Convert the floating-point numbers `vals` to their 32-bit binary
+    representations.
+    """
+    return _vals2bin(vals, "f", ">f4")
+
+
+def float2bin64_array(vals: Iterable[float]) -> List[str]:
+    """
+    Convert the floating-point numbers `vals` to their 64-bit binary
+    representations.
+    """
+    return _vals2bin(vals, "d", ">f8")
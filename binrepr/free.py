@@ -26,57 +26,98 @@ __all__ = [
     "bin2float",
 ]
 
-from math import inf, nan, isinf, isnan, log10
+import struct
+from functools import lru_cache
+from math import inf, nan, isinf, isnan, ldexp, log10
+from typing import Tuple
+
+from .fixed import _BYTE2BIN
 
 _LOG10_2 = log10(2)
 _MIN_N_BITS = 8
 
+_UNPACKERS = {
+    16: struct.Struct(">e"),
+    32: struct.Struct(">f"),
+    64: struct.Struct(">d"),
+}
+
 
 def _fill_bits(b: str, n_bits: int, bit: bool = False) -> str:
     """
     Fill the binary representation `b` to the length `n_bits` with bits
     corresponding to `bit`.
     """
-    n_bits = n_bits - len(b)
-    if n_bits < 0:
+    if n_bits < len(b):
         raise ValueError("not enough bits")
-    return n_bits * str(int(bit)) + b
+    return b.rjust(n_bits, "1") if bit else b.zfill(n_bits)
+
+
+def _bin2dec(b: str) -> int:
+    """Convert the binary representation `b` to its decimal integer."""
+    b = b.lstrip("0")
+    return int(b, 2) if b else 0
 
 
-def _dec2bin(d: int, inv: bool = False) -> str:
+@lru_cache(maxsize=None)
+def _float_layout(n_bits: int) -> Tuple[int, int, int]:
     """
-    Convert the decimal integer `d` to its binary representation and, if `inv`
-    is true, invert the bits.
+    Return the boundary indices of the sign, exponent and significand fields
+    in the binary representation of a floating-point number of the bit size
+    `n_bits`.
     """
-    b = ""
-    if inv:
-        true_bit = "0"
-        false_bit = "1"
-    else:
-        true_bit = "1"
-        false_bit = "0"
-    while d > 0:
-        b = (true_bit if d & 1 else false_bit) + b
-        d >>= 1
-    return b
+    return 1, 1 + n_exp_bits(n_bits), n_bits
+
+
+@lru_cache(maxsize=None)
+def _bin_fmt(n_bits: int) -> str:
+    """Return the zero-padded binary format specification for `n_bits`."""
+    return f"0{n_bits}b"
+
+
+@lru_cache(maxsize=None)
+def _mask(n_bits: int) -> int:
+    """Return the bit mask with the `n_bits` lowest bits set."""
+    return (1 << n_bits) - 1
+
+
+def _float_scale(f: float) -> Tuple[float, int]:
+    """
+    Scale the positive floating-point number `f` into the interval [1, 2) and
+    return it together with the applied power of 2.
+    """
+    shift = 0
+    while f < 1.0:
+        f *= 2.0
+        shift -= 1
+    while f >= 2.0:
+        f *= 0.5
+        shift += 1
+    return f, shift
 
 
-def _bin2dec(b: str, inv: bool = False) -> int:
+def _float2bin_mantissa(f: float, precision: int) -> int:
     """
-    Convert the binary representation `b` to its decimal integer.  If `inv` is
-    true, use inverted bits.
+    Extract `precision` mantissa bits from the floating-point number `f` in
+    the interval [0, 1) and return them packed in an integer.
     """
-    bit = "0" if inv else "1"
-    i = 0
-    while i < len(b) and b[i] != bit:
-        i += 1
-    d = 0
-    pos = 1
-    for c in reversed(b[i:]):
-        if c == bit:
-            d += pos
-        pos <<= 1
-    return d
+    mantissa = 0
+    for _ in range(precision):
+        f *= 2.0
+        bit = 1 if f >= 1.0 else 0
+        f -= bit
+        mantissa = (mantissa << 1) | bit
+    return mantissa
+
+
+try:
+    from numba import njit
+except ImportError:
+    _float_scale_jit = None
+    _float2bin_mantissa_jit = None
+else:
+    _float_scale_jit = njit(cache=True)(_float_scale)
+    _float2bin_mantissa_jit = njit(cache=True)(_float2bin_mantissa)
 
 
 def max_uint(n_bits: int) -> int:
@@ -94,6 +135,7 @@ def min_int(n_bits: int) -> int:
     return -max_uint(n_bits - 1) - 1
 
 
+@lru_cache(maxsize=None)
 def max_n_digits(n_bits: int, signed: bool = False) -> int:
     """
     Return the maximum number of decimal digits needed to represent an integer
@@ -104,6 +146,7 @@ def max_n_digits(n_bits: int, signed: bool = False) -> int:
     return int(n_bits * _LOG10_2) + 1
 
 
+@lru_cache(maxsize=None)
 def n_exp_bits(n_bits: int) -> int:
     """
     Return the number of bits needed to represent the exponent of a
@@ -125,6 +168,7 @@ def n_exp_bits(n_bits: int) -> int:
     return n_exponent_bits
 
 
+@lru_cache(maxsize=None)
 def n_significand_bits(n_bits: int) -> int:
     """
     Return the number of bits needed to represent the significand of a
@@ -141,6 +185,7 @@ def n_significand_digits(n_bits: int) -> float:
     return n_significand_bits(n_bits) * _LOG10_2
 
 
+@lru_cache(maxsize=None)
 def exp_bias(n_bits: int) -> int:
     """
     Return the exponent bias of a floating-point number of the bit size
@@ -149,6 +194,7 @@ def exp_bias(n_bits: int) -> int:
     return max_int(n_exp_bits(n_bits))
 
 
+@lru_cache(maxsize=None)
 def max_exp(n_bits: int) -> int:
     """
     Return the maximum exponent with base 2 of a floating-point number of the
@@ -157,6 +203,7 @@ def max_exp(n_bits: int) -> int:
     return exp_bias(n_bits)
 
 
+@lru_cache(maxsize=None)
 def min_exp(n_bits: int, subnorm: bool = False) -> int:
     """
     Return the minimum exponent with base 2 of a floating-point number of the
@@ -169,6 +216,12 @@ def min_exp(n_bits: int, subnorm: bool = False) -> int:
     )
 
 
+# warm the caches for the standard widths
+for _n_bits in (8, 16, 32, 64, 128, 256):
+    n_exp_bits(_n_bits)
+del _n_bits
+
+
 def max_n_exp_digits(n_bits: int) -> int:
     """
     Return the maximum number of decimal digits needed to represent the
@@ -182,7 +235,7 @@ def max_float(n_bits: int) -> float:
     Return the largest positive floating-point number of the bit size `n_bits`.
     """
     n = n_significand_bits(n_bits)
-    return float((2**n - 1) * 2 ** (max_exp(n_bits) - n + 1))
+    return ldexp(2.0 - 2.0 ** -(n - 1), max_exp(n_bits))
 
 
 def min_float(n_bits: int, subnorm: bool = False) -> float:
@@ -209,12 +262,12 @@ def bin2bool(b: str) -> bool:
 def char2bin(c: str) -> str:
     """Convert the character `c` to its binary representation."""
     i = ord(c)
-    return _fill_bits(_dec2bin(i), 8 if i < 256 else 32)
+    return _BYTE2BIN[i] if i < 256 else format(i, "032b")
 
 
 def bin2char(b: str) -> str:
     """Convert the binary representation `b` to its character."""
-    return chr(_bin2dec(b))
+    return chr(int(b, 2))
 
 
 def uint2bin(i: int, n_bits: int) -> str:
@@ -224,7 +277,9 @@ def uint2bin(i: int, n_bits: int) -> str:
     """
     if i < 0:
         raise ValueError("unsigned integer expected")
-    return _fill_bits(_dec2bin(i), n_bits)
+    if i > _mask(n_bits):
+        raise ValueError("not enough bits")
+    return format(i, _bin_fmt(n_bits))
 
 
 def bin2uint(b: str) -> int:
@@ -237,21 +292,15 @@ def int2bin(i: int, n_bits: int) -> str:
     Convert the signed integer `i` to its binary representation of the length
     `n_bits`.
     """
-    inv = i < 0
-    if inv:
-        sign = "1"
-        i = -i - 1
-    else:
-        sign = "0"
-    return sign + _fill_bits(_dec2bin(i, inv), n_bits - 1, inv)
+    if not min_int(n_bits) <= i <= max_int(n_bits):
+        raise ValueError("not enough bits")
+    return format(i & _mask(n_bits), _bin_fmt(n_bits))
 
 
 def bin2int(b: str) -> int:
     """Convert the binary representation `b` to its signed integer."""
-    sign = b[0]
-    inv = sign == "1"
-    i = _bin2dec(b[1:], inv)
-    return -i - 1 if inv else i
+    i = int(b, 2)
+    return i - (1 << len(b)) if b[0] == "1" else i
 
 
 def float2bin(f: float, n_bits: int) -> str:
@@ -273,45 +322,51 @@ def float2bin(f: float, n_bits: int) -> str:
     max_exponent = (1 << n_exponent_bits) - 1
     exponent = max_exponent >> 1
     if not isinf(f):
-        while f < 1:
-            f *= 2
-            exponent -= 1
-        while f >= 2:
-            f *= 0.5
-            exponent += 1
+        scale = _float_scale if _float_scale_jit is None else _float_scale_jit
+        f, shift = scale(f)
+        exponent += shift
     else:
         exponent = max_exponent
     if exponent >= max_exponent:
         return sign + n_exponent_bits * "1" + n_mantissa_bits * "0"
-    mantissa = ""
     precision = n_mantissa_bits
+    lead = 0
     if exponent <= 0:
         precision += exponent - 1
         exponent = 0
         if precision >= 0:
-            mantissa += "1"
+            # leading bit of the subnormal significand
+            lead = 1
     # subtracting leading 1 and adding the smallest bit to round the value
     f += 0.5 ** (n_mantissa_bits + 1) - 1
-    for _ in range(precision):
-        f *= 2
-        if f >= 1:
-            f -= 1
-            mantissa += "1"
-        else:
-            mantissa += "0"
+    if precision > 0:
+        # the jitted extraction packs the bits in a 64-bit integer
+        extract = (
+            _float2bin_mantissa_jit
+            if _float2bin_mantissa_jit is not None and precision < 64
+            else _float2bin_mantissa
+        )
+        bits = lead << precision | extract(f, precision)
+        mantissa = format(bits, _bin_fmt(precision + lead))
+    else:
+        mantissa = "1" if lead else ""
     return (
         sign
-        + _fill_bits(_dec2bin(exponent), n_exponent_bits)
+        + format(exponent, _bin_fmt(n_exponent_bits))
         + _fill_bits(mantissa, n_mantissa_bits)
     )
 
 
 def bin2float(b: str) -> float:
     """Convert the binary representation `b` to its floating-point number."""
-    n_exponent_bits = n_exp_bits(len(b))
+    unpacker = _UNPACKERS.get(len(b))
+    if unpacker is not None:
+        return unpacker.unpack(int(b, 2).to_bytes(len(b) // 8, "big"))[0]
+    _, split, _ = _float_layout(len(b))
+    n_exponent_bits = split - 1
     sign = b[0]
-    exponent = b[1 : n_exponent_bits + 1]
-    mantissa = b[n_exponent_bits + 1 :]
+    exponent = b[1:split]
+    mantissa = b[split:]
     if "0" in exponent:
         dec_exponent = _bin2dec(exponent)
         pos = 2 ** (dec_exponent + 1 - (1 << n_exponent_bits - 1))
@@ -3,9 +3,20 @@ Functions for printing integers and floating-point numbers in binary
 representations.
 """
 
-__all__ = ["print_int_bin", "print_float_bin"]
+__all__ = [
+    "print_int_bin",
+    "print_float_bin",
+    "print_ints_bin",
+    "print_floats_bin",
+]
 
-from .free import n_exp_bits
+import sys
+from typing import Iterable
+
+from .free import _float_layout
+
+_RESET = "\x1b[m"
+_PREFIXES = tuple(f"\x1b[{30 + color}m" for color in range(8))
 
 
 def _fmt(string: str, color: int) -> str:
@@ -13,7 +24,7 @@ def _fmt(string: str, color: int) -> str:
     Add to the string `string` an ANSI escape code for the standard color with
     the number `color` (0..7).
     """
-    return f"\x1b[{30 + color}m{string}\x1b[m"
+    return _PREFIXES[color] + string + _RESET
 
 
 def print_int_bin(b: str) -> None:
@@ -28,9 +39,30 @@ def print_float_bin(b: str) -> None:
     Print the binary representation `b` of an floating-point number to the
     standard output.
     """
-    n_exponent_bits = n_exp_bits(len(b))
-    print(
-        _fmt(b[0], 4)
-        + _fmt(b[1 : n_exponent_bits + 1], 2)
-        + _fmt(b[n_exponent_bits + 1 :], 1)
-    )
+    _, split, _ = _float_layout(len(b))
+    print(_fmt(b[0], 4) + _fmt(b[1:split], 2) + _fmt(b[split:], 1))
+
+
+def print_ints_bin(bins: Iterable[str]) -> None:
+    """
+    Print the binary representations `bins` of integers to the standard
+    output with a single write.
+    """
+    buf = []
+    for b in bins:
+        buf.append(_fmt(b[0], 4) + _fmt(b[1:], 1) + "\n")
+    sys.stdout.write("".join(buf))
+
+
+def print_floats_bin(bins: Iterable[str]) -> None:
+    """
+    Print the binary representations `bins` of floating-point numbers to the
+    standard output with a single write.
+    """
+    buf = []
+    for b in bins:
+        _, split, _ = _float_layout(len(b))
+        buf.append(
+            _fmt(b[0], 4) + _fmt(b[1:split], 2) + _fmt(b[split:], 1) + "\n"
+        )
+    sys.stdout.write("".join(buf))